@@ -0,0 +1,11 @@
+CREATE OR REPLACE PROCEDURE public.process_housework_batch()
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- Populate fact_housework_tasks from the stg table
+    CALL public.populate_fact_housework_tasks();
+    -- Backfill agg_daily_housework_tasks from fact_housework_tasks
+    CALL public.backfill_agg_daily_housework_tasks();
+    -- Clear the consumed stg rows so the next batch starts from an empty stg table
+    CALL public.truncate_stg_fact_housework_tasks();
+END;
+$$;
\ No newline at end of file